@@ -0,0 +1,4 @@
+# lets the tool run as `python -m Repo_Code_Packager`
+from .main import main
+
+main()
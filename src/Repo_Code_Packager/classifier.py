@@ -0,0 +1,99 @@
+import os
+
+# what to do with each category of low-value content.
+# "exclude" drops the file, "stub" keeps a one-line placeholder, "include" keeps it as is.
+# override per category in the [generated] table of .repo-code-packager-config.toml
+DEFAULT_POLICY = {
+    "lockfile": "stub",
+    "minified": "stub",
+    "sourcemap": "exclude",
+    "generated": "stub",
+}
+ACTIONS = ("exclude", "stub", "include")
+
+LOCKFILE_NAMES = {
+    "package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb",
+    "poetry.lock", "Pipfile.lock", "uv.lock", "pdm.lock", "Cargo.lock", "composer.lock",
+    "Gemfile.lock", "go.sum", "flake.lock", "mix.lock", "pubspec.lock", "Podfile.lock",
+    "packages.lock.json",
+}
+# every pattern is a file name suffix, so names are matched with str.endswith
+NAME_SUFFIXES = [
+    ("minified", ".min.js"),
+    ("minified", ".min.mjs"),
+    ("minified", ".min.css"),
+    # only maps of bundled code, other .map files (game levels, ...) are kept
+    ("sourcemap", ".js.map"),
+    ("sourcemap", ".mjs.map"),
+    ("sourcemap", ".css.map"),
+    ("generated", "_pb2.py"),
+    ("generated", "_pb2.pyi"),
+    ("generated", "_pb2_grpc.py"),
+    ("generated", ".pb.go"),
+    ("generated", ".pb.cc"),
+    ("generated", ".pb.h"),
+    ("generated", ".g.dart"),
+    ("generated", ".freezed.dart"),
+]
+_ALL_SUFFIXES = tuple(suffix for _, suffix in NAME_SUFFIXES)
+
+# how much of a file is read to look for markers and measure lines
+PREFIX_CHARS = 4096
+MARKER_LINES = 5
+GENERATED_MARKERS = ("@generated", "DO NOT EDIT", "do not edit", "Do not edit")
+# minified code has very long lines and almost no whitespace
+MIN_PREFIX_FOR_STATS = 1024
+MINIFIED_AVG_LINE_LENGTH = 300
+MINIFIED_MAX_WHITESPACE_RATIO = 0.1
+
+# validate config overrides and merge them over the defaults
+def load_policy(overrides=None):
+    policy = dict(DEFAULT_POLICY)
+    for category, action in (overrides or {}).items():
+        if category not in DEFAULT_POLICY:
+            raise RuntimeError(f'Unknown generated content category "{category}"')
+        if action not in ACTIONS:
+            raise RuntimeError(f'Action for "{category}" must be one of {", ".join(ACTIONS)}')
+        policy[category] = action
+    return policy
+
+# classify from the file name alone, without touching the file
+def classify_name(file_path):
+    name = os.path.basename(file_path)
+    if name in LOCKFILE_NAMES:
+        return "lockfile"
+    # one endswith over every suffix rejects most files without a loop
+    if name.endswith(_ALL_SUFFIXES):
+        for category, suffix in NAME_SUFFIXES:
+            if name.endswith(suffix):
+                return category
+    return None
+
+# drop the files the policy excludes by name alone, before anything is read.
+# the category of every other classified file is recorded into categories, so later
+# stages do not classify the name again
+def filter_names(files, policy, categories):
+    for file_path in files:
+        category = classify_name(file_path)
+        if category is None:
+            yield file_path
+        elif policy[category] != "exclude":
+            categories[file_path] = category
+            yield file_path
+
+# classify from the first few KB of a file
+def classify_prefix(prefix):
+    lines = prefix.splitlines()
+    for line in lines[:MARKER_LINES]:
+        if any(marker in line for marker in GENERATED_MARKERS):
+            return "generated"
+
+    if len(prefix) >= MIN_PREFIX_FOR_STATS and lines:
+        average_length = len(prefix) / len(lines)
+        whitespace = (prefix.count(" ") + prefix.count("\t")) / len(prefix)
+        if average_length > MINIFIED_AVG_LINE_LENGTH and whitespace < MINIFIED_MAX_WHITESPACE_RATIO:
+            return "minified"
+    return None
+
+def stub_text(category):
+    return f"... (skipped: {category} content)"
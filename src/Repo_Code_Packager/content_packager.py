@@ -1,10 +1,19 @@
+import io
 import os
 import sys
-import json
-from pygments.lexers import guess_lexer_for_filename
-from pygments.util import ClassNotFound
+import time
+from fnmatch import fnmatch
+from itertools import repeat, tee
 from .file_utils import get_all_files
 from .git_utils import get_git_info
+from .classifier import classify_name, classify_prefix, stub_text, PREFIX_CHARS
+
+# files larger than this are truncated in the output
+MAX_FILE_SIZE_KB = 16
+MAX_BYTES = MAX_FILE_SIZE_KB * 1024
+TRUNCATION_NOTE = f"\n... (file truncated due to size > {MAX_FILE_SIZE_KB}KB)"
+# --estimate groups files without an extension under this key
+NO_EXTENSION = "(none)"
 
 class ContentPackager:
     def __init__(self, repo_path, output_file, line_numbers=False):
@@ -41,7 +50,9 @@ class ContentPackager:
             print(f"Error writing output file: {e}")
         
 # create tree structure reflecting depth of file and directories
-def create_structure_tree(file_list, base_path):
+# annotations optionally maps a file path to a note shown next to it
+def create_structure_tree(file_list, base_path, annotations=None):
+    annotations = annotations or {}
     tree = {}
     for file_path in file_list:
         relative_path = os.path.relpath(file_path, base_path)
@@ -52,7 +63,7 @@ def create_structure_tree(file_list, base_path):
             if part not in current_level:
                 current_level[part] = {}
             current_level = current_level[part]
-        current_level[parts[-1]] = None
+        current_level[parts[-1]] = annotations.get(file_path)
 
     def generate_tree_string(d, indent=''):
         lines = []
@@ -61,7 +72,8 @@ def create_structure_tree(file_list, base_path):
         for i, (name, content) in enumerate(items):
             is_last = i == len(items) - 1
             prefix = '└── ' if is_last else '├── '
-            lines.append(f"{indent}{prefix}{name}")
+            note = f"  ({content})" if isinstance(content, str) else ""
+            lines.append(f"{indent}{prefix}{name}{note}")
             if isinstance(content, dict): # If it's a directory, go one level deeper.
                 connector = '    ' if is_last else '│   '
                 lines.extend(generate_tree_string(content, indent + connector))
@@ -70,73 +82,362 @@ def create_structure_tree(file_list, base_path):
 
 # gather the file contents and merge into a big string block.
 def format_file_contents(file_list, base_path, args):
-    all_contents = []
+    blocks, total_lines, total_chars = format_file_blocks(file_list, base_path, args)
+    return "\n\n".join(block for _, block in blocks), total_lines, total_chars
+
+# format every file as its own "### File:" block.
+# file_list can be any iterable, including a stream that is still being produced;
+# files are formatted as they arrive and the blocks are put in path order at the end.
+# returns a list of (relative_path, block) pairs in output order.
+# excluded, if given, collects the files the classifier dropped after reading their first few KB.
+# name_categories, if given, holds the categories classifier.filter_names already found from
+# the file names; files missing from it have none. without it the names are classified here.
+def format_file_blocks(file_list, base_path, args, excluded=None, name_categories=None):
+    blocks = []
     total_lines = 0
     total_chars = 0
-    MAX_FILE_SIZE_KB = 16
-    MAX_BYTES = MAX_FILE_SIZE_KB * 1024
 
-    for file_path in sorted(file_list):
-        try:
-            file_size = os.path.getsize(file_path)
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                relative_path = os.path.relpath(file_path, base_path)
-                all_contents.append(f"### File: {relative_path}")
-                
-                content = f.read()
-
-                # Lab3-1: add line numbers to the output file
-                if args.line_numbers:
-                    lines = content.splitlines()
-                    numbered_lines = [f"{i+1}: {line}" for i, line in enumerate(lines)]
-                    content = "\n".join(numbered_lines)
-
-                if file_size > MAX_BYTES:
-                    content = content[:MAX_BYTES]
-                    truncation_note = f"\n... (file truncated due to size > {MAX_FILE_SIZE_KB}KB)"
-                    content += truncation_note
-
-                lang_name = ""
-                try:
-                    # find the language from file name
-                    lexer = guess_lexer_for_filename(file_path, content)
-                    lang_name = lexer.aliases[0] if lexer.aliases else ""
-                except ClassNotFound:
-                    # if it failes to find language name
-                    pass
-
-                # Add the content inside a markdown code block.
-                all_contents.append(f"```{lang_name}\n{content}\n```")
-                
-                # Count lines for the summary later.
-                total_lines += content.count('\n') + 1
-                total_chars += len(content)
+    # plain values only, so the options can be sent to worker processes
+    options = {
+        'line_numbers': args.line_numbers,
+        'outline': getattr(args, 'outline', False),
+        'outline_full': getattr(args, 'outline_full', None) or [],
+        # category -> action from classifier.load_policy, or None to keep everything
+        'generated': getattr(args, 'generated', None),
+        'names_classified': name_categories is not None,
+    }
+    # --workers is sized for slow directory listings; formatting is CPU bound,
+    # so more processes than cores would only add start-up cost
+    processes = min(getattr(args, 'workers', 1), os.cpu_count() or 1)
 
-        except Exception as e:
-            print(f"Error reading file {file_path}: {e}", file=sys.stderr)
-    return "\n\n".join(all_contents), total_lines, total_chars
+    # the stream is read once, so each file is paired with its category as it arrives
+    file_list, lookups = tee(file_list)
+    categories = (name_categories.get(file_path) if name_categories else None for file_path in lookups)
+
+    if processes > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        # lexing and outlining are CPU bound, so files are spread over processes
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_format_file_block, file_list, repeat(base_path), repeat(options),
+                                        categories, chunksize=16))
+    else:
+        results = [_format_file_block(file_path, base_path, options, category)
+                   for file_path, category in zip(file_list, categories)]
+
+    results = [result for result in results if result is not None]
+    if excluded is not None:
+        excluded.extend(result[0] for result in results if result[1] is None)
+    results = sorted((result for result in results if result[1] is not None), key=lambda result: result[0])
+    for _, relative_path, block, content in results:
+        blocks.append((relative_path, block))
+
+        # Count lines for the summary later.
+        total_lines += content.count('\n') + 1
+        total_chars += len(content)
+    return blocks, total_lines, total_chars
+
+# read and format a single file.
+# returns (file_path, relative_path, block, content), (file_path, None, None, None) if the
+# classifier excludes it, or None if the file cannot be read.
+# category is the one found from the file name, when options['names_classified'] is set.
+def _format_file_block(file_path, base_path, options, category=None):
+    try:
+        file_size = os.path.getsize(file_path)
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            relative_path = os.path.relpath(file_path, base_path)
+
+            # look at the name and the first few KB before reading the rest
+            content = ""
+            if options['generated']:
+                if not options['names_classified']:
+                    category = classify_name(file_path)
+                if category is None:
+                    content = f.read(PREFIX_CHARS)
+                    category = classify_prefix(content)
+
+            action = options['generated'][category] if category else "include"
+            if action == "exclude":
+                return file_path, None, None, None
+            if action == "include":
+                content += f.read()
+
+        if action == "stub":
+            content = stub_text(category)
+            return file_path, relative_path, f"### File: {relative_path}\n\n```\n{content}\n```", content
+
+        if options['outline'] and not _matches_any(relative_path, options['outline_full']):
+            from .outline import extract_outline
+            lexer = _guess_lexer(file_path, content)
+            content = format_outline(extract_outline(file_path, content, lexer), content, options['line_numbers'])
+        else:
+            # Lab3-1: add line numbers to the output file
+            if options['line_numbers']:
+                lines = content.splitlines()
+                numbered_lines = [f"{i+1}: {line}" for i, line in enumerate(lines)]
+                content = "\n".join(numbered_lines)
+
+            if file_size > MAX_BYTES:
+                content = content[:MAX_BYTES]
+                content += TRUNCATION_NOTE
+
+            lexer = _guess_lexer(file_path, content)
+
+        lang_name = ""
+        if lexer is not None:
+            lang_name = lexer.aliases[0] if lexer.aliases else ""
+
+        # Add the content inside a markdown code block.
+        return file_path, relative_path, f"### File: {relative_path}\n\n```{lang_name}\n{content}\n```", content
+
+    except Exception as e:
+        print(f"Error reading file {file_path}: {e}", file=sys.stderr)
+        return None
+
+# pygments is imported on first use; it is the slowest import of the package
+def _guess_lexer(file_path, content):
+    from pygments.lexers import guess_lexer_for_filename
+    from pygments.util import ClassNotFound
+    try:
+        # find the language from file name
+        return guess_lexer_for_filename(file_path, content)
+    except ClassNotFound:
+        # if it failes to find language name
+        return None
+
+def _matches_any(relative_path, patterns):
+    name = os.path.basename(relative_path)
+    return any(fnmatch(relative_path, p) or fnmatch(name, p) for p in patterns)
+
+# render outline entries, keeping the original line numbers when requested
+def format_outline(outline, content, line_numbers=False):
+    total = content.count('\n') + (0 if content.endswith('\n') or not content else 1)
+    if not outline:
+        return f"... (outline: {total} lines, no definitions found)"
+
+    if line_numbers:
+        lines = [f"{number}: {text}" for number, text in outline]
+    else:
+        lines = [text for _, text in outline]
+    lines.append(f"... (outline: {len(outline)} of {total} lines shown)")
+    return "\n".join(lines)
+
+# project the output size and tokens from stat data alone, without opening any file.
+# stats is a list of os.stat_result (or None for files that vanished), matching file_list.
+# with a generated-content policy, files stubbed by name count as their placeholder.
+# the language tag of the code fence is left out: it is a few bytes and finding it
+# would cost a pygments lookup per extension.
+# name_categories is the same as for format_file_blocks.
+# report is the rest of the report (tree, git info, summary, ...) as it would be written;
+# without a 'file_contents' key, as with --dirs-only, no file is counted and the
+# tokens are those of the report, as --tokens counts them.
+def estimate_package(file_list, base_path, stats, generated=None, report=None, name_categories=None):
+    report_bytes = 0
+    if report is not None:
+        out = io.StringIO()
+        write_markdown(report, out)
+        text = out.getvalue()
+        report_bytes = len(text.encode('utf-8'))
+        if 'file_contents' not in report:
+            return {'files': len(file_list), 'bytes': report_bytes, 'tokens': len(text) // 4,
+                    'report_bytes': report_bytes, 'by_extension': {}}
+
+    by_extension = {}
+
+    for file_path, stat in zip(file_list, stats):
+        if stat is None:
+            continue
+        relative_path = os.path.relpath(file_path, base_path)
+        extension = os.path.splitext(file_path)[1].lower() or NO_EXTENSION
+
+        category = None
+        if generated:
+            category = name_categories.get(file_path) if name_categories is not None else classify_name(file_path)
+        if category and generated[category] == "stub":
+            content_bytes = len(stub_text(category))
+        else:
+            content_bytes = min(stat.st_size, MAX_BYTES)
+            if stat.st_size > MAX_BYTES:
+                content_bytes += len(TRUNCATION_NOTE)
+        # "### File: ...\n\n```\n" + content + "\n```" + blank line separator
+        block_bytes = len(f"### File: {relative_path}\n\n```\n\n```\n\n".encode('utf-8')) + content_bytes
+
+        entry = by_extension.setdefault(extension, {'files': 0, 'bytes': 0, 'content_bytes': 0})
+        entry['files'] += 1
+        entry['bytes'] += block_bytes
+        entry['content_bytes'] += content_bytes
+
+    # same rule as --tokens: the summed file content divided by four, floored once
+    total_content = sum(e['content_bytes'] for e in by_extension.values())
+    for entry in by_extension.values():
+        entry['tokens'] = entry.pop('content_bytes') // 4
+    return {
+        'files': sum(e['files'] for e in by_extension.values()),
+        'bytes': report_bytes + sum(e['bytes'] for e in by_extension.values()),
+        'tokens': total_content // 4,
+        'report_bytes': report_bytes,
+        'by_extension': by_extension
+    }
+
+def format_estimate(estimate):
+    lines = [
+        "# Size Estimate",
+        "",
+        f"- Total files: {estimate['files']}",
+        f"- Estimated output bytes: {estimate['bytes']}",
+        f"- Estimated tokens: {estimate['tokens']}",
+    ]
+    if estimate.get('report_bytes'):
+        lines.append(f"- Structure, git info and summary: {estimate['report_bytes']} bytes")
+    if not estimate['by_extension']:
+        return "\n".join(lines)
+
+    lines += [
+        "",
+        "| extension | files | bytes | tokens |",
+        "| --------- | ----- | ----- | ------ |"
+    ]
+    # biggest contributors first
+    ranked = sorted(estimate['by_extension'].items(), key=lambda item: item[1]['bytes'], reverse=True)
+    for extension, entry in ranked:
+        lines.append(f"| {extension} | {entry['files']} | {entry['bytes']} | {entry['tokens']} |")
+    return "\n".join(lines)
+
+# list files by their last commit, newest first, using get_last_commits data.
+def generate_recent_commits(file_list, last_commits, now=None):
+    now = time.time() if now is None else now
+    committed = [(last_commits[f], f) for f in file_list if f in last_commits]
+    committed.sort(key=lambda item: item[0]['time'], reverse=True)
+
+    lines = []
+    for commit, file_path in committed:
+        days_ago = int((now - commit['time']) // 86400)
+        lines.append(f"- {os.path.basename(file_path)} (committed {days_ago} days ago by {commit['author']}, {commit['hash']})")
+    if not lines:
+        return "No files committed in the last 7 days."
+    return "\n".join(lines)
 
 # calculate entire number of files and number of lines.
+# total_lines is None when the contents were never read (e.g. --dirs-only).
 def generate_summary(file_list, total_lines):
     file_count = len(file_list)
+    if total_lines is None:
+        return f"- Total files: {file_count}"
     summary_string = (
         f"- Total files: {file_count}\n"
         f"- Total lines: {total_lines}"
     )
     return summary_string
 
+# list files with how long ago they were modified.
+# mtimes are the modification timestamps matching file_list (None if unknown).
+def generate_recent_changes(file_list, mtimes, now=None):
+    now = time.time() if now is None else now
+    lines = []
+    for file_path, mtime in zip(file_list, mtimes):
+        if mtime is None:
+            continue
+        days_ago = int((now - mtime) // 86400)
+        lines.append(f"- {os.path.basename(file_path)} (modified {days_ago} days ago)")
+    if not lines:
+        return "No files modified in the last 7 days."
+    return "\n".join(lines)
+
 def format_json(data):
+    import json
     # get the dictionary data and convert to json string
     return json.dumps(data, indent=2)
 
 def format_markdown(data):
     # get the dictionary data and convert to markdown string
-    output_parts = [
+    out = io.StringIO()
+    write_markdown(data, out)
+    return out.getvalue()
+
+# streaming writers: they write straight to a file object, so several output
+# formats can be produced from the same data without building each one in memory.
+# data['file_contents'] may be a string or a list of file blocks, which are
+# written one by one separated by a blank line.
+# the file contents and recent changes sections are left out when data has no such key.
+def write_markdown(data, out):
+    out.write("\n\n".join(_markdown_head(data)))
+    if 'file_contents' in data:
+        out.write("\n\n## File Contents\n\n")
+        for i, part in enumerate(_content_parts(data['file_contents'])):
+            if i:
+                out.write("\n\n")
+            out.write(part)
+    if 'recent_changes' in data:
+        out.write(f"\n\n## Recent Changes\n\n{data['recent_changes']}")
+    out.write(f"\n\n## Summary\n\n{data['summary']}")
+
+# same output as format_json
+def write_json(data, out):
+    import json
+    out.write("{")
+    for i, (key, value) in enumerate(data.items()):
+        out.write(f"{',' if i else ''}\n  {json.dumps(key)}: ")
+        if key == 'file_contents' and isinstance(value, list):
+            # one JSON string, escaped block by block
+            out.write('"')
+            for j, block in enumerate(value):
+                if j:
+                    # the blank line between blocks, already escaped
+                    out.write("\\n\\n")
+                out.write(json.dumps(block)[1:-1])
+            out.write('"')
+        else:
+            out.write(json.dumps(value, indent=2).replace("\n", "\n  "))
+    out.write("\n}" if data else "}")
+
+WRITERS = {
+    'markdown': write_markdown,
+    'json': write_json,
+}
+
+def _content_parts(file_contents):
+    if isinstance(file_contents, list):
+        return file_contents
+    return [file_contents]
+
+# the sections written before the file contents
+def _markdown_head(data):
+    return [
         f"# Repository Context",
         f"## File System Location\n\n{data['base_path']}",
         f"## Git Info\n\n{data['git_info']}",
-        f"## Structure\n\n{data['structure_tree']}",
-        f"## File Contents\n\n{data['file_contents']}",
-        f"## Summary\n\n{data['summary']}"
+        f"## Structure\n\n{data['structure_tree']}"
     ]
-    return "\n\n".join(output_parts)
\ No newline at end of file
+
+# byte offset and length of every file block inside the markdown package,
+# so a reader can seek straight to a file instead of scanning for headers.
+def build_package_index(data, blocks):
+    # everything before the first block: the earlier sections and the contents heading
+    prefix = "\n\n".join(_markdown_head(data)) + "\n\n## File Contents\n\n"
+    offset = len(prefix.encode('utf-8'))
+
+    files = []
+    for relative_path, block in blocks:
+        length = len(block.encode('utf-8'))
+        files.append({"path": relative_path, "offset": offset, "length": length})
+        # blocks are separated by a blank line
+        offset += length + 2
+    return {"version": 1, "files": files}
+
+# call after the package is written: its size ties the index to this package,
+# so a reader can refuse an index left over from an earlier run
+def write_package_index(index, output_file):
+    import json
+    from .package_reader import INDEX_SUFFIX
+    index = dict(index, package_size=os.path.getsize(output_file))
+    index_file = output_file + INDEX_SUFFIX
+    with open(index_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    return index_file
+
+# an index from an earlier run would not match a package written without --index
+def remove_stale_index(output_file):
+    from .package_reader import INDEX_SUFFIX
+    try:
+        os.remove(output_file + INDEX_SUFFIX)
+    except FileNotFoundError:
+        pass
@@ -1,28 +1,166 @@
 import os
+import threading
 import time
 
 # find the files and directory
 # Issue #2 Fix: Return absolute paths [9/14/2025]
-def get_all_files(paths, exclude_dirs=None):
+def get_all_files(paths, exclude_dirs=None, workers=1):
     all_files = []
     excluded_set = set(exclude_dirs) if exclude_dirs else set()
 
-    for path in paths:
-        # Convert the input path to an absolute path
-        abs_path = os.path.abspath(path)
-        # if the path leads to file, add it to list
-        if os.path.isfile(abs_path):
-            if not os.path.basename(abs_path).startswith('.'):
-                all_files.append(abs_path)
-        # if the path is directory, add all the files under it
-        elif os.path.isdir(abs_path):
-            for root, dirs, files in os.walk(abs_path):
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in excluded_set]
-                for file in files:
-                    if not file.startswith('.'):
-                        all_files.append(os.path.join(root, file))
+    # with more than one worker, directory listings are fetched concurrently
+    executor = None
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for path in paths:
+            # Convert the input path to an absolute path
+            abs_path = os.path.abspath(path)
+            # if the path leads to file, add it to list
+            if os.path.isfile(abs_path):
+                if not os.path.basename(abs_path).startswith('.'):
+                    all_files.append(abs_path)
+            # if the path is directory, add all the files under it
+            elif os.path.isdir(abs_path):
+                if executor:
+                    all_files.extend(_walk_parallel(abs_path, excluded_set, executor))
+                    continue
+                for root, dirs, files in os.walk(abs_path):
+                    dirs[:] = [d for d in dirs if not d.startswith('.') and d not in excluded_set]
+                    for file in files:
+                        if not file.startswith('.'):
+                            all_files.append(os.path.join(root, file))
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
     return all_files
 
+# read a NUL- or newline-separated list of paths (e.g. from `git ls-files -z`)
+# and yield each file as soon as it arrives. relative paths resolve against base_path.
+# the list is NUL-separated if the first chunk holds a NUL, newline-separated otherwise.
+def iter_files_from(stream, base_path, exclude_dirs=None):
+    excluded_set = set(exclude_dirs) if exclude_dirs else set()
+    separator = None
+    pending = b""
+
+    # read1 returns whatever is available instead of waiting for a full buffer
+    read = getattr(stream, 'read1', stream.read)
+    while True:
+        chunk = read(65536)
+        if not chunk:
+            break
+        pending += chunk
+
+        if separator is None:
+            # a newline-separated list never contains NUL, while NUL-separated
+            # names may contain newlines
+            if b"\0" in pending:
+                separator = b"\0"
+            elif b"\n" in pending:
+                separator = b"\n"
+            else:
+                continue
+
+        *entries, pending = pending.split(separator)
+        for entry in entries:
+            file_path = _resolve_listed_file(entry, base_path, excluded_set)
+            if file_path:
+                yield file_path
+
+    # the last entry may not have a trailing separator
+    file_path = _resolve_listed_file(pending, base_path, excluded_set)
+    if file_path:
+        yield file_path
+
+# apply the same dotfile and exclude_dirs rules as the directory walk
+def _resolve_listed_file(entry, base_path, excluded_set):
+    name = os.fsdecode(entry).rstrip("\r")
+    if not name:
+        return None
+
+    abs_path = os.path.normpath(os.path.join(base_path, name))
+    relative_dirs = os.path.relpath(os.path.dirname(abs_path), base_path).split(os.sep)
+    if any((d.startswith('.') and d not in ('.', '..')) or d in excluded_set for d in relative_dirs):
+        return None
+    if os.path.basename(abs_path).startswith('.') or not os.path.isfile(abs_path):
+        return None
+    return abs_path
+
+# list one directory the same way os.walk does, already pruned
+# returns (subdirectories to descend into, file names)
+def _scan_dir(path, excluded_set):
+    dirs = []
+    files = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    if not entry.name.startswith('.'):
+                        files.append(entry.name)
+                # os.walk does not follow symlinked directories by default
+                elif not entry.name.startswith('.') and entry.name not in excluded_set and not entry.is_symlink():
+                    dirs.append(entry.name)
+    except OSError:
+        # os.walk silently skips directories it cannot list
+        pass
+    return dirs, files
+
+# walk a directory tree with listings running on a worker pool.
+# each worker queues the subdirectories it finds before returning, so the listing of
+# a directory starts as soon as its parent is listed, however far behind the consumer is.
+# results are consumed in the same top-down order os.walk uses, so the output is identical.
+def _walk_parallel(top, excluded_set, executor):
+    found = []
+    pending = {}
+    lock = threading.Lock()
+
+    def scan(path):
+        dirs, files = _scan_dir(path, excluded_set)
+        for d in dirs:
+            child = os.path.join(path, d)
+            future = executor.submit(scan, child)
+            with lock:
+                pending[child] = future
+        return dirs, files
+
+    with lock:
+        pending[top] = executor.submit(scan, top)
+    stack = [top]
+
+    while stack:
+        root = stack.pop()
+        # the parent's listing registered this future before it returned
+        with lock:
+            future = pending.pop(root)
+        dirs, files = future.result()
+
+        children = [os.path.join(root, d) for d in dirs]
+        found.extend(os.path.join(root, file) for file in files)
+        # reversed so the first child is visited next, like os.walk
+        stack.extend(reversed(children))
+    return found
+
+# stat every file without opening it. missing files get None.
+# with more than one worker the stat calls run on a thread pool.
+def get_file_stats(file_list, workers=1):
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_stat_or_none, file_list))
+    return [_stat_or_none(file_path) for file_path in file_list]
+
+def _stat_or_none(file_path):
+    try:
+        return os.stat(file_path)
+    except OSError:
+        return None
+
 # check if a file was modified recently
 def is_recently_modified(file_path, days=7):
     try:
@@ -30,4 +168,4 @@ def is_recently_modified(file_path, days=7):
         now = time.time()
         return (now - last_modified) <= days * 86400
     except FileNotFoundError:
-        return False
\ No newline at end of file
+        return False
@@ -1,4 +1,6 @@
+import os
 import subprocess
+import time
 
 def get_git_info(repo_path):
     try:
@@ -33,4 +35,110 @@ def get_git_info(repo_path):
         )
     
     except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError, OSError):
-        return "Not a git repository"
\ No newline at end of file
+        return "Not a git repository"
+
+# last commit (short hash, unix time, author) of every file, from a single streamed
+# `git log --name-only` pass that stops as soon as all files have been seen.
+# returns {file_path: {'hash', 'time', 'author'}}; files git does not know are left out.
+def get_last_commits(repo_path, file_list):
+    # git prints paths relative to repo_path with forward slashes
+    wanted = {}
+    for file_path in file_list:
+        relative_path = os.path.relpath(file_path, repo_path)
+        if not relative_path.startswith(os.pardir + os.sep):
+            wanted[relative_path.replace(os.sep, "/")] = file_path
+    if not wanted:
+        return {}
+
+    # a file the history never touches (untracked, ignored, only staged) would keep
+    # the log below running to the first commit, so only committed files are looked up
+    committed = _committed_paths(repo_path)
+    wanted = {path: file_path for path, file_path in wanted.items() if path in committed}
+    if not wanted:
+        return {}
+
+    # %x1e starts a commit header, %x1f separates its fields.
+    # -z separates every record with NUL and never quotes paths, whatever they contain
+    git_format = "%x1e%h%x1f%ct%x1f%an"
+    try:
+        process = subprocess.Popen(
+            ['git', 'log', '-z', '--relative', '--name-only', f'--format={git_format}', '--', '.'],
+            cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+    except (FileNotFoundError, NotADirectoryError, OSError):
+        return {}
+
+    last_commits = {}
+    commit = None
+    first_name = False
+    try:
+        for record in _nul_records(process.stdout):
+            if record.startswith(b"\x1e"):
+                short_hash, timestamp, author = record[1:].decode('utf-8', errors='replace').split("\x1f", 2)
+                commit = {'hash': short_hash, 'time': int(timestamp), 'author': author}
+                first_name = True
+                continue
+            # git puts a newline between the header and the first name of a commit
+            if first_name and record.startswith(b"\n"):
+                record = record[1:]
+            first_name = False
+
+            if record and commit:
+                # the newest commit touching a file comes first
+                file_path = wanted.pop(os.fsdecode(record), None)
+                if file_path:
+                    last_commits[file_path] = commit
+                    if not wanted:
+                        break
+    finally:
+        # no need to walk the rest of the history
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+    return last_commits
+
+# every file in HEAD under repo_path, relative to it with forward slashes
+def _committed_paths(repo_path):
+    try:
+        output = subprocess.run(
+            ['git', 'ls-tree', '-r', '-z', '--name-only', 'HEAD'],
+            cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True
+        ).stdout
+    except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError, OSError):
+        return set()
+    return {os.fsdecode(path) for path in output.split(b"\0") if path}
+
+# True if path is inside a git work tree
+def is_git_repository(path):
+    try:
+        subprocess.run(
+            ['git', 'rev-parse', '--is-inside-work-tree'],
+            cwd=path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError, OSError):
+        return False
+    return True
+
+# split a binary stream on NUL as it is read
+def _nul_records(stream):
+    pending = b""
+    while True:
+        chunk = stream.read1(65536)
+        if not chunk:
+            break
+        *records, pending = (pending + chunk).split(b"\0")
+        yield from records
+    if pending:
+        yield pending
+
+# check if a commit from get_last_commits is recent
+def is_recently_committed(commit, days=7, now=None):
+    if not commit:
+        return False
+    now = time.time() if now is None else now
+    return (now - commit['time']) <= days * 86400
+
+def format_commit(commit):
+    date = time.strftime('%Y-%m-%d', time.gmtime(commit['time']))
+    return f"{commit['hash']}, {commit['author']}, {date}"
@@ -1,38 +1,76 @@
 import argparse
 import sys
 import os
-import time
-from file_utils import get_all_files, is_recently_modified
-from git_utils import get_git_info
-from content_packager import create_structure_tree, format_file_contents, generate_summary, format_json, format_markdown
-from toml_utils import load_config
+# everything else is imported inside main() once the arguments are parsed, so that
+# --version and --help never load the config, pygments, subprocess or the thread pools
 
 TOOL_VERSION = "0.1.0"
 
-def build_report(base_path, git_info, structure_tree, file_contents, summary, file_list, args):
-    output_parts = [
-        f"# Repository Context\n\n## File System Location\n\n{base_path}",
-        f"## Git Info\n\n{git_info}",
-        f"## Structure\n\n{structure_tree}"
-    ]
-    
+# pull only the stages the report needs, in an order that lets the contents stage
+# consume a streamed file list before anything else materializes it
+def build_report(pipeline, args):
+    file_contents = None
     if not args.dirs_only:
-        output_parts.append(f"## File Contents\n\n{file_contents}")
+        file_blocks, _, _ = pipeline.contents
+        file_contents = [block for _, block in file_blocks]
 
-    # 'recent_summary' section
+    report_data = {
+        "base_path": pipeline.base_path,
+        "git_info": pipeline.git_info,
+        "structure_tree": pipeline.structure_tree,
+    }
+    if file_contents is not None:
+        report_data["file_contents"] = file_contents
     if args.recent:
-        recent_summary = "\n## Recent Changes\n"
-        if file_list:
-            for f in file_list:
-                days_ago = int((time.time() - os.path.getmtime(f)) // 86400)
-                recent_summary += f"- {os.path.basename(f)} (modified {days_ago} days ago)\n"
-        else:
-            recent_summary += "No files modified in the last 7 days.\n"
-        output_parts.append(recent_summary)
+        report_data["recent_changes"] = pipeline.recent_changes
+    report_data["summary"] = pipeline.summary
+    return report_data
 
-    output_parts.append(f"## Summary\n\n{summary}")
-    
-    return "\n\n".join(output_parts)
+# the report build_report would return, without reading any file: the contents are
+# left empty and the summary has no line count
+def _estimate_report(pipeline, args):
+    from .content_packager import generate_summary
+    report_data = {
+        "base_path": pipeline.base_path,
+        "git_info": pipeline.git_info,
+        "structure_tree": pipeline.structure_tree,
+    }
+    if not args.dirs_only:
+        report_data["file_contents"] = []
+    if args.recent:
+        report_data["recent_changes"] = pipeline.recent_changes
+    report_data["summary"] = generate_summary(pipeline.file_list, None)
+    return report_data
+
+# counts what goes through a stream, for --tokens when the contents are not read
+class _CharCounter:
+    def __init__(self, out):
+        self.out = out
+        self.chars = 0
+
+    def write(self, text):
+        self.chars += len(text)
+        self.out.write(text)
+
+# pair every --output with its --style.
+# returns a list of (style, path) where a path of None means standard output.
+def _output_targets(styles, outputs):
+    styles = styles or []
+    outputs = outputs or []
+
+    if not outputs:
+        if len(styles) > 1:
+            raise ValueError("only one --style can be printed to standard output; add an --output for each style")
+        return [(styles[0] if styles else "markdown", None)]
+
+    if not styles:
+        # pick the style from the file extension
+        return [("json" if path.lower().endswith(".json") else "markdown", path) for path in outputs]
+    if len(styles) == 1:
+        return [(styles[0], path) for path in outputs]
+    if len(styles) != len(outputs):
+        raise ValueError("give one --style for each --output")
+    return list(zip(styles, outputs))
 
 def main():
     # ArgumentParser object creation
@@ -49,14 +87,25 @@ def main():
     # file or directory argument
     parser.add_argument(
         "paths",
-        nargs = "+", # 1 or more
+        nargs = "*", # 1 or more, unless --files-from is used
         help = "Paths to files or directories to include in the context."
     )
 
+    # read the file list from stdin or a file instead of walking the paths
+    parser.add_argument(
+        "--files-from",
+        metavar="FILE",
+        help="Read a NUL- or newline-separated file list from FILE ('-' for stdin). "
+             "Relative paths resolve against the first path, or the current directory."
+    )
+
     # optional feature 1: Output to file
     parser.add_argument(
         "-o", "--output",
-        help = "Path to the output file. If not specified, prints to standard output."
+        action = "append",
+        default = None,
+        help = "Path to the output file. If not specified, prints to standard output. "
+               "Repeat with --style to write several formats in one run."
     )
 
     # optional feature 2: Token counting
@@ -72,6 +121,13 @@ def main():
         action="store_true",
         help="Only include files modified within the last 7 days"
     )
+
+    # use git history instead of filesystem mtimes (meaningful in fresh CI checkouts)
+    parser.add_argument(
+        "-g", "--git-history",
+        action="store_true",
+        help="Annotate the tree with each file's last commit and base --recent on commit times."
+    )
     
     # Lab3-1: adds line numbers to the output file
     parser.add_argument(
@@ -90,11 +146,61 @@ def main():
     # Lab6: output format style
     parser.add_argument(
         "--style",
-        default="markdown",
+        action="append",
+        default=None,
         choices=["markdown", "json"],
-        help="The output format (markdown or json)."
+        help="The output format (markdown or json). Repeat to pair one style with each --output; "
+             "without --style the format follows the output file extension."
     )
 
+    # number of workers listing directories and formatting files concurrently
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of workers used to walk directories and format files in parallel."
+    )
+
+    # emit only module, class and function signatures instead of full contents
+    parser.add_argument(
+        "--outline",
+        action="store_true",
+        help="Show only definitions and docstring first lines instead of full file contents."
+    )
+
+    parser.add_argument(
+        "--outline-full",
+        action="append",
+        metavar="PATTERN",
+        help="With --outline, still show files matching this glob pattern in full (repeatable)."
+    )
+
+    # project output size and tokens from file sizes without reading any file
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Estimate output size and tokens per extension from file sizes only, without reading files."
+    )
+
+    # lockfiles, minified bundles, source maps and generated code are skipped by default
+    parser.add_argument(
+        "--keep-generated",
+        action="store_true",
+        help="Include lockfiles, minified, source map and generated files in full."
+    )
+
+    # write a byte-offset table of contents next to the output file
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Write a sidecar index (<output>.idx.json) with the byte offset of each file block."
+    )
+
+    # --version and --help exit here, before any config or heavy module is loaded
+    parser.parse_args()
+
+    from .toml_utils import load_config
+
     #load default values from .toml config
     try:
         defaults = load_config(".repo-code-packager-config.toml")
@@ -103,63 +209,151 @@ def main():
     
     # find exclude_dirs. if not found, set to empty list
     exclude_list = []
+    generated_overrides = {}
+    # output and style are repeatable, and argparse appends to a list default
+    # instead of replacing it, so the config values are only used as a fallback
+    config_targets = {}
     if defaults:
         exclude_list = defaults.pop("exclude_dirs", [])
+        generated_overrides = defaults.pop("generated", {})
+        for key in ("output", "style"):
+            value = defaults.pop(key, None)
+            config_targets[key] = [value] if value else None
         parser.set_defaults(**defaults)
 
-    # pare the argument
+    # pare the argument again, now with the config defaults
     args = parser.parse_args()
 
+    # command line values override the config
+    if args.output is None:
+        args.output = config_targets.get("output")
+    if args.style is None:
+        args.style = config_targets.get("style")
+
+    try:
+        targets = _output_targets(args.style, args.output)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.index and not any(style == 'markdown' and path for style, path in targets):
+        parser.error("--index requires --output with the markdown style")
+    if args.index and args.dirs_only:
+        parser.error("--index cannot be used with --dirs-only")
+    # both change the size of every file in ways only reading it can tell
+    if args.estimate and (args.line_numbers or args.outline):
+        parser.error("--estimate cannot be used with --line-numbers or --outline")
+
+    if not args.paths and not args.files_from:
+        parser.error("the following arguments are required: paths")
+
+    import contextlib
+    from .classifier import filter_names, load_policy
+    from .file_utils import get_all_files, is_recently_modified, iter_files_from
+    from .pipeline import PackagePipeline
+
+    try:
+        args.generated = None if args.keep_generated else load_policy(generated_overrides)
+    except RuntimeError as e:
+        sys.exit(f"Runtime Error: {e}")
+
     print(f"DEBUG: Files to ignore: {exclude_list}")
 
-    first_path_abs = os.path.abspath(args.paths[0])
+    first_path_abs = os.path.abspath(args.paths[0] if args.paths else os.curdir)
     base_path = os.path.dirname(first_path_abs) if os.path.isfile(first_path_abs) else first_path_abs
 
-    # get all the files from provided path
-    file_list = get_all_files(args.paths, exclude_list)
+    # the file list stays open until the pipeline has read every name from it
+    with contextlib.ExitStack() as stack:
+        if args.files_from:
+            # stream the list so reading and formatting start while it is still arriving
+            try:
+                if args.files_from == "-":
+                    list_file = sys.stdin.buffer
+                else:
+                    list_file = stack.enter_context(open(args.files_from, 'rb'))
+            except OSError as e:
+                sys.exit(f"Error reading file list {args.files_from}: {e}")
+            file_source = iter_files_from(list_file, base_path, exclude_list)
+        else:
+            # get all the files from provided path
+            file_source = get_all_files(args.paths, exclude_list, args.workers)
 
-    if args.recent:
-        file_list = [f for f in file_list if is_recently_modified(f)]
+        last_commits = None
+        if args.recent and args.git_history:
+            from .git_utils import get_last_commits, is_git_repository, is_recently_committed
+            # without a history every file would look old and nothing would be packaged
+            if not is_git_repository(base_path):
+                sys.exit(f"Error: --recent with --git-history needs a git repository, {base_path} is not in one")
+            # commit times come from one git log pass over the whole list
+            file_source = list(file_source)
+            last_commits = get_last_commits(base_path, file_source)
+            file_source = [f for f in file_source if is_recently_committed(last_commits.get(f))]
+        elif args.recent:
+            file_source = (f for f in file_source if is_recently_modified(f))
+
+        name_categories = None
+        if args.generated:
+            # drop what the file name alone marks as excluded, before anything is read
+            name_categories = {}
+            file_source = filter_names(file_source, args.generated, name_categories)
+
+        # every stage runs only if the chosen output needs it
+        pipeline = PackagePipeline(base_path, file_source, args, last_commits, name_categories)
 
-    if not file_list:
+        if args.estimate:
+            from .content_packager import estimate_package, format_estimate
+            if not pipeline.file_list:
+                print("Error: No files found in the specified paths.", file=sys.stderr)
+                sys.exit(1)
+            stats = None if args.dirs_only else pipeline.stats
+            estimate = estimate_package(pipeline.file_list, base_path, stats, args.generated,
+                                        _estimate_report(pipeline, args), name_categories)
+            print(format_estimate(estimate))
+            return
+
+        # files are read and formatted once, whatever the number of output formats
+        report_data = build_report(pipeline, args)
+
+    if not pipeline.file_list:
         print("Error: No files found in the specified paths.", file=sys.stderr)
         sys.exit(1)
 
-    git_info_str = get_git_info(base_path)
-    structure_tree_str = create_structure_tree(file_list, base_path)
-    file_contents_str, total_lines, total_chars = format_file_contents(file_list, base_path, args)
-    summary_str = generate_summary(file_list, total_lines)
+    from .content_packager import build_package_index, write_package_index, remove_stale_index, WRITERS
 
-    report_data = {
-        "base_path": base_path,
-        "git_info": git_info_str,
-        "structure_tree": structure_tree_str,
-        "file_contents": file_contents_str,
-        "summary": summary_str
-    }
+    written_chars = None
+    for style, output in targets:
+        write = WRITERS[style]
+        # optional feature 1: Output to file
+        if output:
+            try:
+                # newline='' keeps the byte offsets in the index valid on every platform
+                with open(output, 'w', encoding='utf-8', newline='') as f:
+                    counter = _CharCounter(f)
+                    write(report_data, counter)
+                print(f"Context successfully written to {output}", file=sys.stderr)
 
-    final_output = ""
-    if args.style == 'json':
-        final_output = format_json(report_data)
-    else:
-        final_output = format_markdown(report_data)
+                if args.index and style == 'markdown':
+                    index_file = write_package_index(build_package_index(report_data, pipeline.contents[0]), output)
+                    print(f"Index successfully written to {index_file}", file=sys.stderr)
+                elif style == 'markdown':
+                    remove_stale_index(output)
+            except IOError as e:
+                print(f"Error writing to file {output}: {e}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            counter = _CharCounter(sys.stdout)
+            write(report_data, counter)
+            sys.stdout.write("\n")
+        if written_chars is None:
+            written_chars = counter.chars
 
     # optional feature 2: Token counting
     if args.tokens:
-        estimated_tokens = total_chars // 4
+        if args.dirs_only:
+            # the contents were never read, so count the report that was written instead
+            estimated_tokens = written_chars // 4
+        else:
+            estimated_tokens = pipeline.contents[2] // 4
         print(f"Estimated tokens: {estimated_tokens}", file=sys.stderr)
 
-    # optional feature 1: Output to file
-    if args.output:
-        try:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(final_output.strip())
-            print(f"Context successfully written to {args.output}", file=sys.stderr)
-        except IOError as e:
-            print(f"Error writing to file {args.output}: {e}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        print(final_output.strip())
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,100 @@
+import ast
+from pygments.token import Keyword, Name, Text, Whitespace
+
+# keywords that introduce a definition in languages whose lexer does not
+# tag the defined name as Name.Function or Name.Class (javascript, go, ...)
+DEFINITION_KEYWORDS = {
+    "class", "def", "enum", "fn", "func", "function", "impl", "interface",
+    "module", "struct", "trait", "type",
+}
+
+# extract the definitions of a file as (line number, text) pairs.
+# python files go through ast, everything else through the pygments token stream.
+def extract_outline(file_path, content, lexer=None):
+    if file_path.endswith(".py"):
+        try:
+            return outline_python(content)
+        except (SyntaxError, ValueError):
+            # fall back to the lexer for files that are not valid python 3
+            pass
+    if lexer is None:
+        return []
+    return outline_tokens(content, lexer)
+
+def outline_python(content):
+    tree = ast.parse(content)
+    outline = []
+
+    doc = _first_doc_line(tree)
+    if doc:
+        outline.append((tree.body[0].lineno, f'"""{doc}"""'))
+
+    def visit(body, indent):
+        for node in body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                continue
+            for decorator in node.decorator_list:
+                outline.append((decorator.lineno, f"{indent}@{ast.unparse(decorator)}"))
+            outline.append((node.lineno, indent + _signature(node)))
+
+            doc = _first_doc_line(node)
+            if doc:
+                outline.append((node.body[0].lineno, f'{indent}    """{doc}"""'))
+            # methods are part of the outline, nested helper functions are not
+            if isinstance(node, ast.ClassDef):
+                visit(node.body, indent + "    ")
+
+    visit(tree.body, "")
+    return outline
+
+def _signature(node):
+    if isinstance(node, ast.ClassDef):
+        bases = [ast.unparse(b) for b in node.bases] + [ast.unparse(k) for k in node.keywords]
+        return f"class {node.name}({', '.join(bases)}):" if bases else f"class {node.name}:"
+
+    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+    return f"{prefix} {node.name}({ast.unparse(node.args)}){returns}:"
+
+def _first_doc_line(node):
+    doc = ast.get_docstring(node)
+    if not doc or not doc.strip():
+        return ""
+    return doc.strip().splitlines()[0]
+
+# keep every source line where the lexer reports a function or class name,
+# or a name right after a definition keyword
+def outline_tokens(content, lexer):
+    source_lines = content.splitlines()
+    outline = []
+    seen = set()
+    line_number = 1
+    after_keyword = False
+
+    # the default lexer strips leading blank lines, which would shift line numbers
+    lexer = type(lexer)(stripnl=False)
+    for token_type, value in lexer.get_tokens(content):
+        if token_type in Text or token_type in Whitespace:
+            if "\n" in value:
+                line_number += value.count("\n")
+                after_keyword = False
+            continue
+
+        is_definition = token_type in Name.Function or token_type in Name.Class
+        if token_type in Name:
+            # the first name after the keyword on the same line, e.g. go's "func (r T) Name"
+            is_definition = is_definition or after_keyword
+            after_keyword = False
+        elif token_type in Keyword and value in DEFINITION_KEYWORDS:
+            after_keyword = True
+
+        if is_definition and line_number not in seen:
+            seen.add(line_number)
+            if line_number <= len(source_lines):
+                text = source_lines[line_number - 1].rstrip()
+                # drop the opening brace of C-like bodies
+                if text.endswith("{"):
+                    text = text[:-1].rstrip()
+                outline.append((line_number, text))
+        line_number += value.count("\n")
+    return outline
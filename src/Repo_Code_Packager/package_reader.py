@@ -0,0 +1,106 @@
+import argparse
+import json
+import mmap
+import os
+import sys
+
+INDEX_SUFFIX = ".idx.json"
+
+# random access to a markdown package written with --index.
+# the package is memory-mapped and every lookup is a single slice at a known offset.
+class PackageReader:
+    def __init__(self, package_path, index_path=None):
+        self.package_path = package_path
+        self.index_path = index_path or package_path + INDEX_SUFFIX
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            raise RuntimeError(f'Cannot read package index "{self.index_path}"')
+
+        self.entries = {entry["path"]: (entry["offset"], entry["length"]) for entry in index["files"]}
+
+        self._file = open(package_path, 'rb')
+        if index.get("package_size") != os.fstat(self._file.fileno()).st_size:
+            self._file.close()
+            raise RuntimeError(f'Package index "{self.index_path}" does not match "{package_path}"')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # an empty file cannot be mapped
+            self._map = b""
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def paths(self):
+        return list(self.entries)
+
+    # the whole "### File:" block, header and code fence included
+    def read_block(self, path):
+        path = os.path.normpath(path)
+        if path not in self.entries:
+            raise KeyError(f"{path} is not in the package")
+        offset, length = self.entries[path]
+        return self._map[offset:offset + length].decode('utf-8')
+
+    # only the file contents, without the header and the code fence
+    def read_file(self, path):
+        block = self.read_block(path)
+        # skip "### File: ...", the blank line and the opening ```lang line
+        fence_start = block.index("```")
+        body_start = block.index("\n", fence_start) + 1
+        return block[body_start:-len("\n```")]
+
+    # every file under a directory, keyed by path
+    def read_dir(self, path):
+        return {p: self.read_file(p) for p in self.paths_under(path)}
+
+    def paths_under(self, path):
+        prefix = os.path.normpath(path)
+        if prefix == ".":
+            prefix = ""
+        elif not prefix.endswith(os.sep):
+            prefix += os.sep
+        return [p for p in self.entries if p.startswith(prefix)]
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract files from a package written with --index"
+    )
+    parser.add_argument("package", help="Path to the markdown package.")
+    parser.add_argument("paths", nargs="*", help="Files or directories to extract.")
+    parser.add_argument("--list", action="store_true", help="List the files in the package.")
+    args = parser.parse_args()
+
+    try:
+        reader = PackageReader(args.package)
+    except (RuntimeError, OSError) as e:
+        sys.exit(f"Error: {e}")
+
+    with reader:
+        if args.list or not args.paths:
+            print("\n".join(reader.paths()))
+            return
+
+        for path in args.paths:
+            try:
+                blocks = [reader.read_block(path)]
+            except KeyError:
+                blocks = [reader.read_block(p) for p in reader.paths_under(path)]
+            if not blocks:
+                print(f"Error: {path} is not in the package", file=sys.stderr)
+                sys.exit(1)
+            print("\n\n".join(blocks))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+from functools import cached_property
+from .file_utils import get_file_stats
+from .git_utils import get_git_info, get_last_commits, format_commit
+from .content_packager import create_structure_tree, format_file_blocks, generate_summary, generate_recent_changes, generate_recent_commits
+
+# the packaging stages, each computed the first time it is used.
+# an output that never asks for the file contents never reads a file.
+class PackagePipeline:
+    def __init__(self, base_path, file_source, args, last_commits=None, name_categories=None):
+        self.base_path = base_path
+        self.args = args
+        self._file_source = file_source
+        # filled by classifier.filter_names as the source is read, None if it was not used
+        self.name_categories = name_categories
+        # already known when --recent filtered the files by commit time
+        if last_commits is not None:
+            self.__dict__['last_commits'] = last_commits
+
+    # walk: the list of files to package
+    @cached_property
+    def file_list(self):
+        return list(self._file_source)
+
+    # stat: one os.stat_result (or None) per file
+    @cached_property
+    def stats(self):
+        return get_file_stats(self.file_list, getattr(self.args, 'workers', 1))
+
+    @cached_property
+    def git_info(self):
+        return get_git_info(self.base_path)
+
+    # git history: last commit of every file, from one git log pass
+    @cached_property
+    def last_commits(self):
+        return get_last_commits(self.base_path, self.file_list)
+
+    @cached_property
+    def structure_tree(self):
+        annotations = None
+        if getattr(self.args, 'git_history', False):
+            annotations = {f: format_commit(commit) for f, commit in self.last_commits.items()}
+        return create_structure_tree(self.file_list, self.base_path, annotations)
+
+    # contents: (blocks, total_lines, total_chars) from format_file_blocks.
+    # files the classifier excludes once read are dropped from file_list as well,
+    # so the tree and the summary only count what was packaged
+    @cached_property
+    def contents(self):
+        excluded = []
+        if 'file_list' in self.__dict__:
+            contents = format_file_blocks(self.file_list, self.base_path, self.args, excluded, self.name_categories)
+            file_list = self.file_list
+        else:
+            # nothing has walked yet, so format straight from the source while recording the
+            # files, letting a streamed file list be read as it arrives
+            file_list = []
+            contents = format_file_blocks(_record(self._file_source, file_list), self.base_path, self.args, excluded,
+                                          self.name_categories)
+
+        if excluded:
+            excluded = set(excluded)
+            file_list = [f for f in file_list if f not in excluded]
+            # stages already computed from the longer list would no longer line up with it
+            for stage in _FILE_LIST_STAGES:
+                self.__dict__.pop(stage, None)
+        self.__dict__['file_list'] = file_list
+        return contents
+
+    @cached_property
+    def recent_changes(self):
+        if getattr(self.args, 'git_history', False):
+            return generate_recent_commits(self.file_list, self.last_commits)
+        mtimes = [stat.st_mtime if stat else None for stat in self.stats]
+        return generate_recent_changes(self.file_list, mtimes)
+
+    # the line count needs the contents, so --dirs-only summaries leave it out
+    @cached_property
+    def summary(self):
+        total_lines = None if self.args.dirs_only else self.contents[1]
+        return generate_summary(self.file_list, total_lines)
+
+# stages built from file_list, recomputed if contents drops files from it
+_FILE_LIST_STAGES = ("stats", "structure_tree", "recent_changes")
+
+def _record(files, into):
+    for file_path in files:
+        into.append(file_path)
+        yield file_path
@@ -0,0 +1,157 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from Repo_Code_Packager.classifier import classify_name, classify_prefix, filter_names, load_policy, DEFAULT_POLICY
+from Repo_Code_Packager.content_packager import format_file_blocks, estimate_package
+
+
+class TestClassifyName:
+    """Tests for classify_name function"""
+
+    def test_known_lockfiles(self):
+        """Lockfiles should be recognised by name"""
+        for name in ["package-lock.json", "yarn.lock", "poetry.lock", "Cargo.lock", "go.sum"]:
+            assert classify_name(os.path.join("repo", name)) == "lockfile"
+
+    def test_name_patterns(self):
+        """Minified bundles, source maps and protobuf output should be recognised"""
+        assert classify_name("dist/app.min.js") == "minified"
+        assert classify_name("dist/app.js.map") == "sourcemap"
+        assert classify_name("dist/app.css.map") == "sourcemap"
+        assert classify_name("proto/api_pb2.py") == "generated"
+        assert classify_name("proto/api.pb.go") == "generated"
+
+    def test_regular_files(self):
+        """Ordinary source files should not be classified"""
+        assert classify_name("src/main.py") is None
+        assert classify_name("package.json") is None
+        assert classify_name("maps/world.map") is None
+
+
+class TestFilterNames:
+    """Tests for filter_names function"""
+
+    def test_drops_excluded_and_records_the_rest(self):
+        """Excluded names are dropped, other classified names keep their category"""
+        files = ["a/yarn.lock", "a/app.js.map", "a/main.py"]
+        categories = {}
+
+        kept = list(filter_names(files, load_policy(), categories))
+
+        assert kept == ["a/yarn.lock", "a/main.py"]
+        assert categories == {"a/yarn.lock": "lockfile"}
+
+    def test_names_are_not_classified_again(self, tmp_path, monkeypatch):
+        """format_file_blocks should use the recorded categories instead of the names"""
+        from Repo_Code_Packager import content_packager
+        (tmp_path / "yarn.lock").write_text("lock content\n")
+        (tmp_path / "main.py").write_text("print('hi')\n")
+        policy = load_policy()
+        categories = {}
+        files = filter_names(sorted(str(p) for p in tmp_path.iterdir()), policy, categories)
+        monkeypatch.setattr(content_packager, "classify_name", lambda name: pytest.fail("classified twice"))
+        args = type('Args', (), {'line_numbers': False, 'generated': policy})()
+
+        blocks = dict(format_file_blocks(files, str(tmp_path), args, name_categories=categories)[0])
+
+        assert "skipped: lockfile" in blocks["yarn.lock"]
+        assert "print('hi')" in blocks["main.py"]
+
+
+class TestClassifyPrefix:
+    """Tests for classify_prefix function"""
+
+    def test_generated_markers_in_first_lines(self):
+        """@generated and DO NOT EDIT markers should mark generated code"""
+        assert classify_prefix("// Code generated by protoc-gen-go. DO NOT EDIT.\npackage api\n") == "generated"
+        assert classify_prefix("# @generated by some tool\nx = 1\n") == "generated"
+
+    def test_markers_further_down_are_ignored(self):
+        """Markers below the first few lines should not count"""
+        prefix = "x = 1\n" * 10 + "# DO NOT EDIT this constant\n"
+        assert classify_prefix(prefix) is None
+
+    def test_minified_code(self):
+        """Long lines without whitespace should be detected as minified"""
+        prefix = "var a=function(b){return b+1};" * 200
+        assert classify_prefix(prefix) == "minified"
+
+    def test_long_prose_lines_are_not_minified(self):
+        """Long lines with normal spacing, like markdown paragraphs, should be kept"""
+        prefix = ("This is a long paragraph of documentation text. " * 20 + "\n") * 5
+        assert classify_prefix(prefix) is None
+
+
+class TestLoadPolicy:
+    """Tests for load_policy function"""
+
+    def test_defaults(self):
+        """No overrides should give the default policy"""
+        assert load_policy() == DEFAULT_POLICY
+
+    def test_overrides(self):
+        """Config values should override single categories"""
+        policy = load_policy({"lockfile": "exclude"})
+        assert policy["lockfile"] == "exclude"
+        assert policy["minified"] == DEFAULT_POLICY["minified"]
+
+    def test_invalid_values_raise_runtime_error(self):
+        """Unknown categories and actions should raise RuntimeError"""
+        with pytest.raises(RuntimeError):
+            load_policy({"vendored": "stub"})
+        with pytest.raises(RuntimeError):
+            load_policy({"lockfile": "skip"})
+
+
+class TestGeneratedContentInBlocks:
+    """Tests for generated content handling in format_file_blocks"""
+
+    def _files(self, tmp_path):
+        (tmp_path / "yarn.lock").write_text("lock content\n" * 100)
+        (tmp_path / "api_pb2.py").write_text("x = 1\n")
+        (tmp_path / "gen.go").write_text("// Code generated. DO NOT EDIT.\npackage gen\n")
+        (tmp_path / "main.py").write_text("print('hi')\n")
+        return sorted(str(p) for p in tmp_path.iterdir())
+
+    def test_stubs_and_excludes(self, tmp_path):
+        """Stubbed files get a placeholder, excluded files are dropped"""
+        args = type('Args', (), {'line_numbers': False, 'generated': load_policy({"generated": "exclude"})})()
+
+        blocks, _, _ = format_file_blocks(self._files(tmp_path), str(tmp_path), args)
+        result = dict(blocks)
+
+        assert set(result) == {"yarn.lock", "main.py"}
+        assert "skipped: lockfile" in result["yarn.lock"]
+        assert "lock content" not in result["yarn.lock"]
+        assert "print('hi')" in result["main.py"]
+
+    def test_excluded_files_are_reported(self, tmp_path):
+        """Files excluded after reading their prefix are collected into excluded"""
+        args = type('Args', (), {'line_numbers': False, 'generated': load_policy({"generated": "exclude"})})()
+        excluded = []
+
+        format_file_blocks(self._files(tmp_path), str(tmp_path), args, excluded)
+
+        assert sorted(os.path.basename(f) for f in excluded) == ["api_pb2.py", "gen.go"]
+
+    def test_without_policy_everything_is_kept(self, tmp_path):
+        """Without a policy files are packaged in full"""
+        args = type('Args', (), {'line_numbers': False})()
+
+        blocks, _, _ = format_file_blocks(self._files(tmp_path), str(tmp_path), args)
+
+        assert len(blocks) == 4
+        assert "lock content" in dict(blocks)["yarn.lock"]
+
+    def test_estimate_counts_stub_size(self, tmp_path):
+        """Estimate should count files stubbed by name as their placeholder"""
+        file_list = self._files(tmp_path)
+        stats = [os.stat(f) for f in file_list]
+
+        full = estimate_package(file_list, str(tmp_path), stats)
+        stubbed = estimate_package(file_list, str(tmp_path), stats, load_policy())
+
+        assert stubbed['bytes'] < full['bytes']
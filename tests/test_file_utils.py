@@ -2,10 +2,12 @@ import pytest
 import os
 import sys
 import time
+import io
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from Repo_Code_Packager.file_utils import get_all_files, is_recently_modified
+from Repo_Code_Packager import file_utils
+from Repo_Code_Packager.file_utils import get_all_files, get_file_stats, is_recently_modified, iter_files_from
 
 
 class TestIsRecentlyModified:
@@ -194,4 +196,170 @@ class TestGetAllFiles:
         
         assert len(result) == 2
         assert str(file1) in result
-        assert str(file2) in result
\ No newline at end of file
+        assert str(file2) in result
+
+class TestParallelGetAllFiles:
+    """Tests for get_all_files with a worker pool"""
+
+    def _make_tree(self, root):
+        for d in ["a/b/c", "a/d", "e", ".hidden", "skip/inner", "e/skip"]:
+            (root / d).mkdir(parents=True, exist_ok=True)
+        for f in ["top.txt", ".dot.txt", "a/one.py", "a/b/two.py", "a/b/c/three.py",
+                  "a/d/four.md", "e/five.txt", ".hidden/six.txt", "skip/inner/seven.txt",
+                  "e/skip/eight.txt"]:
+            (root / f).write_text(f)
+
+    def test_same_files_and_order_as_sequential(self, tmp_path):
+        """Parallel walk should match the sequential walk exactly"""
+        self._make_tree(tmp_path)
+
+        sequential = get_all_files([str(tmp_path)], exclude_dirs=["skip"])
+        parallel = get_all_files([str(tmp_path)], exclude_dirs=["skip"], workers=4)
+
+        assert parallel == sequential
+        assert len(parallel) == 6
+
+    def test_excludes_hidden_and_excluded_dirs(self, tmp_path):
+        """Parallel walk should prune dotfiles and exclude_dirs"""
+        self._make_tree(tmp_path)
+
+        result = get_all_files([str(tmp_path)], exclude_dirs=["skip"], workers=4)
+
+        assert str(tmp_path / "a" / "b" / "c" / "three.py") in result
+        assert not any(".hidden" in f or ".dot" in f for f in result)
+        assert not any(os.sep + "skip" + os.sep in f for f in result)
+
+    def test_mixed_file_and_directory_paths(self, tmp_path):
+        """Files and directories can be mixed with a worker pool"""
+        self._make_tree(tmp_path)
+        paths = [str(tmp_path / "top.txt"), str(tmp_path / "a")]
+
+        assert get_all_files(paths, workers=3) == get_all_files(paths)
+
+    def test_scales_with_workers_on_slow_storage(self, tmp_path, monkeypatch):
+        """With listing latency, more workers should make the walk faster"""
+        def make(root, depth):
+            if depth == 0:
+                return
+            for i in range(4):
+                child = root / f"d{i}"
+                child.mkdir()
+                (child / "f.txt").write_text("x")
+                make(child, depth - 1)
+        make(tmp_path, 3)
+
+        scan_dir = file_utils._scan_dir
+        def slow_scan_dir(path, excluded_set):
+            # simulate a network file system round trip
+            time.sleep(0.01)
+            return scan_dir(path, excluded_set)
+        monkeypatch.setattr(file_utils, "_scan_dir", slow_scan_dir)
+
+        def timed(workers):
+            start = time.perf_counter()
+            result = get_all_files([str(tmp_path)], workers=workers)
+            return time.perf_counter() - start, result
+
+        two_time, two_result = timed(2)
+        many_time, many_result = timed(16)
+
+        assert many_result == two_result
+        assert len(many_result) == 84
+        # 85 directories: about 0.43s with 2 workers, a few round trips with 16
+        assert many_time < two_time * 0.5
+
+    def test_symlinked_directories_are_not_followed(self, tmp_path):
+        """Symlinked directories should be skipped like os.walk does"""
+        self._make_tree(tmp_path)
+        os.symlink(tmp_path / "a", tmp_path / "link")
+
+        sequential = get_all_files([str(tmp_path)])
+        parallel = get_all_files([str(tmp_path)], workers=2)
+
+        assert parallel == sequential
+        assert not any(os.sep + "link" + os.sep in f for f in parallel)
+
+
+class TestGetFileStats:
+    """Tests for get_file_stats function"""
+
+    def test_returns_sizes_in_order(self, tmp_path):
+        """Stats should line up with the given file list"""
+        files = []
+        for i in range(4):
+            f = tmp_path / f"file{i}.txt"
+            f.write_text("x" * i)
+            files.append(str(f))
+
+        sequential = get_file_stats(files)
+        parallel = get_file_stats(files, workers=3)
+
+        assert [s.st_size for s in sequential] == [0, 1, 2, 3]
+        assert [s.st_size for s in parallel] == [0, 1, 2, 3]
+
+    def test_missing_file_returns_none(self, tmp_path):
+        """Files that cannot be stat'ed should give None"""
+        result = get_file_stats([str(tmp_path / "missing.txt")])
+        assert result == [None]
+
+
+class TestIterFilesFrom:
+    """Tests for iter_files_from function"""
+
+    def _make_files(self, root):
+        (root / "src").mkdir()
+        (root / ".git").mkdir()
+        (root / "venv").mkdir()
+        for name in ["a.py", "src/b.py", ".env", ".git/config", "venv/lib.py"]:
+            (root / name).write_text(name)
+
+    def test_newline_separated_list(self, tmp_path):
+        """Newline separated relative paths should resolve against the base"""
+        self._make_files(tmp_path)
+        stream = io.BytesIO(b"a.py\nsrc/b.py\n")
+
+        result = list(iter_files_from(stream, str(tmp_path)))
+
+        assert result == [str(tmp_path / "a.py"), str(tmp_path / "src" / "b.py")]
+
+    def test_nul_separated_list(self, tmp_path):
+        """NUL separated lists like git ls-files -z should be supported"""
+        self._make_files(tmp_path)
+        (tmp_path / "with\nnewline.txt").write_text("odd name")
+        stream = io.BytesIO(b"with\nnewline.txt\0a.py")
+
+        result = list(iter_files_from(stream, str(tmp_path)))
+
+        assert result == [str(tmp_path / "with\nnewline.txt"), str(tmp_path / "a.py")]
+
+    def test_applies_dotfile_and_exclude_rules(self, tmp_path):
+        """Hidden files, hidden dirs and excluded dirs should be skipped"""
+        self._make_files(tmp_path)
+        stream = io.BytesIO(b"a.py\n.env\n.git/config\nvenv/lib.py\nsrc\nmissing.py\n")
+
+        result = list(iter_files_from(stream, str(tmp_path), exclude_dirs=["venv"]))
+
+        assert result == [str(tmp_path / "a.py")]
+
+    def test_absolute_paths_are_kept(self, tmp_path):
+        """Absolute paths should not be joined with the base"""
+        self._make_files(tmp_path)
+        stream = io.BytesIO(str(tmp_path / "a.py").encode() + b"\r\n")
+
+        result = list(iter_files_from(stream, "/somewhere/else"))
+
+        assert result == [str(tmp_path / "a.py")]
+
+    def test_yields_before_stream_ends(self, tmp_path):
+        """Paths should be yielded as soon as their separator arrives"""
+        self._make_files(tmp_path)
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"a.py\n")
+
+        with os.fdopen(read_fd, 'rb') as stream:
+            files = iter_files_from(stream, str(tmp_path))
+            # the writer is still open, so this only works if the entry is streamed
+            assert next(files) == str(tmp_path / "a.py")
+            os.write(write_fd, b"src/b.py")
+            os.close(write_fd)
+            assert list(files) == [str(tmp_path / "src" / "b.py")]
@@ -1,10 +1,11 @@
 import pytest
 import os
 import sys
+import subprocess
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from Repo_Code_Packager.git_utils import get_git_info
+from Repo_Code_Packager.git_utils import get_git_info, get_last_commits, is_git_repository, is_recently_committed, format_commit
 
 
 class TestGetGitInfo:
@@ -49,4 +50,117 @@ class TestGetGitInfo:
             lines = result.split('\n')
             for line in lines:
                 if line.strip():
-                    assert line.startswith('- ')
\ No newline at end of file
+                    assert line.startswith('- ')
+
+
+def _git(repo, *args, date="2024-01-01T00:00:00+00:00", author="Alice"):
+    env = dict(os.environ, GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+    subprocess.run(
+        ['git', '-c', f'user.name={author}', '-c', 'user.email=a@example.com', *args],
+        cwd=repo, env=env, check=True, capture_output=True
+    )
+
+
+def _make_repo(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "sub").mkdir(parents=True)
+    _git(repo, 'init', '-q')
+    (repo / "old.txt").write_text("old")
+    (repo / "sub" / "new file.py").write_text("new")
+    _git(repo, 'add', '.')
+    _git(repo, 'commit', '-q', '-m', 'first', date="2024-01-01T00:00:00+00:00")
+    (repo / "sub" / "new file.py").write_text("changed")
+    _git(repo, 'commit', '-q', '-am', 'second', date="2024-02-01T00:00:00+00:00", author="Bob")
+    return repo
+
+
+class TestGetLastCommits:
+    """Tests for get_last_commits function"""
+
+    def test_maps_each_file_to_its_last_commit(self, tmp_path):
+        """Every file should get the newest commit that touched it"""
+        repo = _make_repo(tmp_path)
+        old = str(repo / "old.txt")
+        new = str(repo / "sub" / "new file.py")
+
+        result = get_last_commits(str(repo), [old, new])
+
+        assert result[old]['author'] == "Alice"
+        assert result[new]['author'] == "Bob"
+        assert result[new]['time'] > result[old]['time']
+        assert len(result[new]['hash']) >= 7
+
+    def test_paths_relative_to_subdirectory(self, tmp_path):
+        """Paths should be matched when the base is a subdirectory of the repo"""
+        repo = _make_repo(tmp_path)
+        new = str(repo / "sub" / "new file.py")
+
+        result = get_last_commits(str(repo / "sub"), [new])
+
+        assert result[new]['author'] == "Bob"
+
+    def test_paths_git_would_quote(self, tmp_path):
+        """Names with quotes, backslashes, tabs or newlines should still be matched"""
+        repo = _make_repo(tmp_path)
+        names = ['quote"d.txt', 'back\\slash.txt', 'tab\tname.txt', 'new\nline.txt', 'ünï.txt']
+        for name in names:
+            (repo / name).write_text(name)
+        _git(repo, 'add', '.')
+        _git(repo, 'commit', '-q', '-m', 'odd names', date="2024-03-01T00:00:00+00:00", author="Carol")
+        files = [str(repo / name) for name in names]
+
+        result = get_last_commits(str(repo), files + [str(repo / "old.txt")])
+
+        assert all(result[f]['author'] == "Carol" for f in files)
+        assert result[str(repo / "old.txt")]['author'] == "Alice"
+
+    def test_untracked_files_are_left_out(self, tmp_path):
+        """Files git has never seen should not be in the result"""
+        repo = _make_repo(tmp_path)
+        untracked = repo / "untracked.txt"
+        untracked.write_text("x")
+
+        result = get_last_commits(str(repo), [str(untracked), str(repo / "old.txt")])
+
+        assert str(untracked) not in result
+        assert str(repo / "old.txt") in result
+
+    def test_history_is_not_read_for_uncommitted_files(self, tmp_path, monkeypatch):
+        """Untracked, ignored or only staged files should not keep git log running"""
+        repo = _make_repo(tmp_path)
+        (repo / ".gitignore").write_text("ignored.txt\n")
+        (repo / "ignored.txt").write_text("x")
+        (repo / "untracked.txt").write_text("x")
+        (repo / "staged.txt").write_text("x")
+        _git(repo, 'add', 'staged.txt')
+        logged = []
+        popen = subprocess.Popen
+        monkeypatch.setattr(subprocess, "Popen", lambda *a, **kw: logged.append(a[0]) or popen(*a, **kw))
+        files = [str(repo / name) for name in ["ignored.txt", "untracked.txt", "staged.txt"]]
+
+        assert get_last_commits(str(repo), files) == {}
+        assert not any("log" in command for command in logged)
+
+    def test_non_git_directory_returns_empty(self, tmp_path):
+        """A directory outside git should give no commits"""
+        (tmp_path / "a.txt").write_text("a")
+        assert get_last_commits(str(tmp_path), [str(tmp_path / "a.txt")]) == {}
+
+    def test_recent_and_format(self):
+        """Commit helpers should check age and format hash, author and date"""
+        commit = {'hash': 'abc1234', 'time': 86400 * 10, 'author': 'Alice'}
+
+        assert is_recently_committed(commit, days=7, now=86400 * 12)
+        assert not is_recently_committed(commit, days=7, now=86400 * 20)
+        assert not is_recently_committed(None)
+        assert format_commit(commit) == "abc1234, Alice, 1970-01-11"
+
+
+class TestIsGitRepository:
+    """Tests for is_git_repository function"""
+
+    def test_inside_and_outside_a_repository(self, tmp_path):
+        """Only directories inside a work tree should count"""
+        repo = _make_repo(tmp_path)
+        assert is_git_repository(str(repo / "sub"))
+        assert not is_git_repository(str(tmp_path))
@@ -0,0 +1,161 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from Repo_Code_Packager.main import _output_targets, main
+
+
+class TestOutputTargets:
+    """Tests for pairing --style and --output"""
+
+    def test_defaults_to_markdown_on_stdout(self):
+        """No style and no output should print markdown"""
+        assert _output_targets(None, None) == [("markdown", None)]
+
+    def test_single_style_to_stdout(self):
+        """A single style without output should print that style"""
+        assert _output_targets(["json"], None) == [("json", None)]
+
+    def test_styles_pair_with_outputs_in_order(self):
+        """Each style should go with the output at the same position"""
+        result = _output_targets(["markdown", "json"], ["out.md", "out.json"])
+        assert result == [("markdown", "out.md"), ("json", "out.json")]
+
+    def test_style_follows_extension_without_style(self):
+        """Without --style the file extension picks the format"""
+        result = _output_targets(None, ["out.md", "OUT.JSON", "out.txt"])
+        assert result == [("markdown", "out.md"), ("json", "OUT.JSON"), ("markdown", "out.txt")]
+
+    def test_one_style_applies_to_every_output(self):
+        """A single style should be used for every output"""
+        assert _output_targets(["json"], ["a", "b"]) == [("json", "a"), ("json", "b")]
+
+    def test_mismatched_counts_raise(self):
+        """Two styles need exactly two outputs"""
+        with pytest.raises(ValueError):
+            _output_targets(["json", "markdown"], ["a", "b", "c"])
+
+    def test_several_styles_to_stdout_raise(self):
+        """Only one format can go to standard output"""
+        with pytest.raises(ValueError):
+            _output_targets(["json", "markdown"], None)
+
+
+class TestConfigOverride:
+    """Tests for command line values overriding the config file in main()"""
+
+    def _run(self, tmp_path, monkeypatch, config, argv):
+        (tmp_path / "proj").mkdir()
+        (tmp_path / "proj" / "a.py").write_text("print('a')\n")
+        (tmp_path / ".repo-code-packager-config.toml").write_text(config)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(sys, "argv", ["main.py", "proj"] + argv)
+        main()
+
+    def test_cli_output_replaces_config_output(self, tmp_path, monkeypatch):
+        """-o on the command line should be used instead of the config output"""
+        self._run(tmp_path, monkeypatch, 'output = "cfg.md"\n', ["-o", "cli.md"])
+
+        assert (tmp_path / "cli.md").exists()
+        assert not (tmp_path / "cfg.md").exists()
+
+    def test_config_output_used_without_cli_output(self, tmp_path, monkeypatch):
+        """The config output should apply when -o is not given"""
+        self._run(tmp_path, monkeypatch, 'output = "cfg.md"\n', [])
+
+        assert (tmp_path / "cfg.md").exists()
+
+    def test_cli_style_replaces_config_style(self, tmp_path, monkeypatch, capsys):
+        """--style on the command line should replace the config style"""
+        self._run(tmp_path, monkeypatch, 'style = "markdown"\n', ["--style", "json"])
+
+        out = capsys.readouterr().out
+        assert '"file_contents"' in out
+        assert "# Repository Context" not in out
+
+class TestFilesFrom:
+    """Tests for the --files-from list handle in main()"""
+
+    def _track_opens(self, monkeypatch):
+        import Repo_Code_Packager.main as main_module
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            f = open(*args, **kwargs)
+            opened.append(f)
+            return f
+
+        monkeypatch.setattr(main_module, "open", tracking_open, raising=False)
+        return opened
+
+    def test_list_file_is_closed(self, tmp_path, monkeypatch):
+        """The file given to --files-from should be closed once the package is built"""
+        (tmp_path / "a.py").write_text("print('a')\n")
+        (tmp_path / "list.txt").write_text("a.py\n")
+        monkeypatch.chdir(tmp_path)
+        opened = self._track_opens(monkeypatch)
+        monkeypatch.setattr(sys, "argv", ["main.py", "--files-from", "list.txt", "-o", "out.md"])
+
+        main()
+
+        list_files = [f for f in opened if f.name == "list.txt"]
+        assert list_files and all(f.closed for f in list_files)
+        assert "a.py" in (tmp_path / "out.md").read_text()
+
+    def test_stdin_is_left_open(self, tmp_path, monkeypatch):
+        """Reading the list from stdin should not close stdin"""
+        import io
+        (tmp_path / "a.py").write_text("print('a')\n")
+        monkeypatch.chdir(tmp_path)
+        stdin = io.TextIOWrapper(io.BytesIO(b"a.py\n"))
+        monkeypatch.setattr(sys, "stdin", stdin)
+        monkeypatch.setattr(sys, "argv", ["main.py", "--files-from", "-", "-o", "out.md"])
+
+        main()
+
+        assert not stdin.buffer.closed
+        assert "a.py" in (tmp_path / "out.md").read_text()
+
+
+class TestEstimate:
+    """Tests for --estimate in main()"""
+
+    def _run(self, tmp_path, monkeypatch, argv):
+        (tmp_path / "proj").mkdir(exist_ok=True)
+        (tmp_path / "proj" / "a.py").write_text("print('a')\n" * 40)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(sys, "argv", ["main.py", "proj"] + argv)
+        main()
+
+    def test_dirs_only_estimates_the_tree(self, tmp_path, monkeypatch, capsys):
+        """--dirs-only --estimate should project the tree-only report, not the contents"""
+        self._run(tmp_path, monkeypatch, ["-d", "-o", "out.md"])
+        written = (tmp_path / "out.md").stat().st_size
+        capsys.readouterr()
+
+        self._run(tmp_path, monkeypatch, ["-d", "--estimate"])
+
+        assert f"- Estimated output bytes: {written}" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("flag", ["--line-numbers", "--outline"])
+    def test_flags_changing_contents_are_rejected(self, tmp_path, monkeypatch, flag):
+        """Flags whose output size needs the file contents cannot be estimated"""
+        with pytest.raises(SystemExit):
+            self._run(tmp_path, monkeypatch, ["--estimate", flag])
+
+
+class TestGitHistory:
+    """Tests for --git-history in main()"""
+
+    def test_recent_outside_a_repository_is_an_error(self, tmp_path, monkeypatch, capsys):
+        """--recent --git-history outside git should say so instead of finding no files"""
+        (tmp_path / "a.py").write_text("print('a')\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(sys, "argv", ["main.py", ".", "--recent", "--git-history"])
+
+        with pytest.raises(SystemExit) as exc:
+            main()
+
+        assert "needs a git repository" in str(exc.value.code)
@@ -0,0 +1,158 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pygments.lexers import get_lexer_by_name
+
+from Repo_Code_Packager.outline import extract_outline, outline_python, outline_tokens
+from Repo_Code_Packager.content_packager import format_file_blocks, format_outline
+
+
+PYTHON_SOURCE = '''"""Module docstring.
+
+More details.
+"""
+import os
+
+
+@decorator(1)
+class Shape(Base, metaclass=Meta):
+    """A shape."""
+
+    def area(self, scale: float = 1.0) -> float:
+        """Compute the area.
+
+        Long description.
+        """
+        def helper():
+            pass
+        return 0.0
+
+    async def fetch(self, *args, **kwargs):
+        pass
+
+
+def top_level(a, b=2):
+    return a + b
+'''
+
+
+class TestOutlinePython:
+    """Tests for the ast based python outline"""
+
+    def test_extracts_signatures_with_line_numbers(self):
+        """Classes, methods and functions should be listed with their line numbers"""
+        result = outline_python(PYTHON_SOURCE)
+
+        assert (1, '"""Module docstring."""') in result
+        assert (8, "@decorator(1)") in result
+        assert (9, "class Shape(Base, metaclass=Meta):") in result
+        assert (12, "    def area(self, scale: float=1.0) -> float:") in result
+        assert (21, "    async def fetch(self, *args, **kwargs):") in result
+        assert (25, "def top_level(a, b=2):") in result
+
+    def test_includes_docstring_first_lines_only(self):
+        """Only the first line of each docstring should be kept"""
+        texts = [text for _, text in outline_python(PYTHON_SOURCE)]
+
+        assert '        """Compute the area."""' in texts
+        assert not any("Long description" in text for text in texts)
+
+    def test_skips_nested_functions(self):
+        """Helpers defined inside functions are implementation details"""
+        texts = [text for _, text in outline_python(PYTHON_SOURCE)]
+
+        assert not any("helper" in text for text in texts)
+
+    def test_invalid_python_falls_back_to_lexer(self):
+        """Files that do not parse should use the token stream instead"""
+        source = "def broken(:\n    pass\n\ndef ok():\n    pass\n"
+
+        result = extract_outline("broken.py", source, get_lexer_by_name("python"))
+
+        assert (4, "def ok():") in result
+
+
+class TestOutlineTokens:
+    """Tests for the pygments token based outline"""
+
+    def test_extracts_definitions_from_other_languages(self):
+        """Function and class names reported by the lexer should be kept"""
+        source = "\n\nclass Greeter {\n  greet() {\n    return 1;\n  }\n}\n\nfunction hello(name) {\n  return name;\n}\n"
+
+        result = outline_tokens(source, get_lexer_by_name("javascript"))
+
+        assert (3, "class Greeter") in result
+        assert (9, "function hello(name)") in result
+
+    def test_name_after_definition_keyword_on_same_line(self):
+        """The first name after a definition keyword should mark the line"""
+        source = "package main\n\nfunc (s S) Run(x int) error {\n\treturn nil\n}\n"
+
+        result = outline_tokens(source, get_lexer_by_name("go"))
+
+        assert result == [(3, "func (s S) Run(x int) error")]
+
+    def test_no_lexer_returns_empty_outline(self):
+        """Unknown file types have no outline"""
+        assert extract_outline("notes.unknown", "some text", None) == []
+
+
+class TestOutlineMode:
+    """Tests for outline mode in format_file_blocks"""
+
+    def test_outline_replaces_file_body(self, tmp_path):
+        """Outline mode should emit signatures instead of the full body"""
+        source = tmp_path / "shapes.py"
+        source.write_text(PYTHON_SOURCE)
+        args = type('Args', (), {'line_numbers': True, 'outline': True})()
+
+        blocks, _, _ = format_file_blocks([str(source)], str(tmp_path), args)
+        block = blocks[0][1]
+
+        assert "25: def top_level(a, b=2):" in block
+        assert "return a + b" not in block
+
+    def test_outline_full_patterns_keep_full_contents(self, tmp_path):
+        """Files matching an outline_full pattern should be emitted in full"""
+        source = tmp_path / "shapes.py"
+        source.write_text(PYTHON_SOURCE)
+        args = type('Args', (), {'line_numbers': False, 'outline': True, 'outline_full': ["shapes.*"]})()
+
+        blocks, _, _ = format_file_blocks([str(source)], str(tmp_path), args)
+
+        assert "return a + b" in blocks[0][1]
+
+    def test_parallel_outline_matches_sequential(self, tmp_path):
+        """Formatting files on worker processes should give the same blocks"""
+        for i in range(5):
+            (tmp_path / f"mod{i}.py").write_text(PYTHON_SOURCE)
+        file_list = [str(p) for p in tmp_path.iterdir()]
+        sequential = type('Args', (), {'line_numbers': False, 'outline': True})()
+        parallel = type('Args', (), {'line_numbers': False, 'outline': True, 'workers': 2})()
+
+        assert format_file_blocks(file_list, str(tmp_path), parallel) == format_file_blocks(file_list, str(tmp_path), sequential)
+
+    def test_processes_are_capped_at_cpu_count(self, tmp_path, monkeypatch):
+        """A large --workers for walking should not start more processes than cores"""
+        import concurrent.futures
+        started = []
+
+        class RecordingPool(concurrent.futures.ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                started.append(max_workers)
+                super().__init__(max_workers)
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", RecordingPool)
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        (tmp_path / "mod.py").write_text(PYTHON_SOURCE)
+        args = type('Args', (), {'line_numbers': False, 'outline': True, 'workers': 32})()
+
+        format_file_blocks([str(tmp_path / "mod.py")], str(tmp_path), args)
+
+        assert started == [2]
+
+    def test_empty_outline_note(self):
+        """Files without definitions should get a short note"""
+        assert format_outline([], "a\nb\n") == "... (outline: 2 lines, no definitions found)"
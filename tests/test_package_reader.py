@@ -0,0 +1,108 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from Repo_Code_Packager.content_packager import (
+    format_file_blocks,
+    format_markdown,
+    build_package_index,
+    write_package_index,
+    remove_stale_index
+)
+from Repo_Code_Packager.package_reader import PackageReader
+
+
+def _write_package(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "pkg" / "sub").mkdir(parents=True)
+    (repo / "readme.md").write_text("# Hello 안녕\n")
+    (repo / "pkg" / "a.py").write_text("print('a')\n")
+    (repo / "pkg" / "sub" / "b.py").write_text("x = 'é'\ny = 2\n")
+    file_list = [str(repo / "readme.md"), str(repo / "pkg" / "a.py"), str(repo / "pkg" / "sub" / "b.py")]
+
+    args = type('Args', (), {'line_numbers': False})()
+    blocks, _, _ = format_file_blocks(file_list, str(repo), args)
+    data = {
+        "base_path": str(repo),
+        "git_info": "Not a git repository",
+        "structure_tree": "└── ü",
+        "file_contents": "\n\n".join(block for _, block in blocks),
+        "summary": "- Total files: 3"
+    }
+    package = tmp_path / "package.md"
+    package.write_bytes(format_markdown(data).encode('utf-8'))
+    write_package_index(build_package_index(data, blocks), str(package))
+    return str(package)
+
+
+class TestPackageReader:
+    """Tests for PackageReader random access"""
+
+    def test_lists_all_files(self, tmp_path):
+        """Index should list every packaged file in output order"""
+        with PackageReader(_write_package(tmp_path)) as reader:
+            assert reader.paths() == [
+                os.path.join("pkg", "a.py"),
+                os.path.join("pkg", "sub", "b.py"),
+                "readme.md"
+            ]
+
+    def test_read_block_returns_exact_block(self, tmp_path):
+        """Offsets should point at the start of each block even with non-ASCII text"""
+        with PackageReader(_write_package(tmp_path)) as reader:
+            block = reader.read_block("readme.md")
+
+        assert block.startswith("### File: readme.md\n\n```")
+        assert block.endswith("```")
+
+    def test_read_file_returns_contents_only(self, tmp_path):
+        """read_file should strip the header and the code fence"""
+        with PackageReader(_write_package(tmp_path)) as reader:
+            assert reader.read_file(os.path.join("pkg", "sub", "b.py")) == "x = 'é'\ny = 2\n"
+            assert reader.read_file("readme.md") == "# Hello 안녕\n"
+
+    def test_read_dir_returns_files_under_directory(self, tmp_path):
+        """read_dir should return every file below the directory"""
+        with PackageReader(_write_package(tmp_path)) as reader:
+            result = reader.read_dir("pkg")
+
+        assert set(result) == {os.path.join("pkg", "a.py"), os.path.join("pkg", "sub", "b.py")}
+        assert result[os.path.join("pkg", "a.py")] == "print('a')\n"
+
+    def test_unknown_path_raises_key_error(self, tmp_path):
+        """Files that are not in the package should raise KeyError"""
+        with PackageReader(_write_package(tmp_path)) as reader:
+            with pytest.raises(KeyError):
+                reader.read_block("missing.py")
+
+    def test_missing_index_raises_runtime_error(self, tmp_path):
+        """A package without an index should raise RuntimeError"""
+        package = tmp_path / "plain.md"
+        package.write_text("# Repository Context")
+
+        with pytest.raises(RuntimeError) as err:
+            PackageReader(str(package))
+
+        assert "Cannot read package index" in str(err.value)
+
+    def test_index_for_other_package_raises_runtime_error(self, tmp_path):
+        """An index left over from an earlier package should be rejected"""
+        package = _write_package(tmp_path)
+        with open(package, 'a', encoding='utf-8') as f:
+            f.write("\nrewritten")
+
+        with pytest.raises(RuntimeError) as err:
+            PackageReader(package)
+
+        assert "does not match" in str(err.value)
+
+    def test_remove_stale_index(self, tmp_path):
+        """remove_stale_index should delete the sidecar and ignore a missing one"""
+        package = _write_package(tmp_path)
+
+        remove_stale_index(package)
+        remove_stale_index(package)
+
+        assert not os.path.exists(package + ".idx.json")
@@ -0,0 +1,104 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from Repo_Code_Packager import pipeline as pipeline_module
+from Repo_Code_Packager.pipeline import PackagePipeline
+from Repo_Code_Packager.main import build_report
+
+
+def _args(**overrides):
+    values = {'line_numbers': False, 'dirs_only': False, 'recent': False, 'workers': 1}
+    values.update(overrides)
+    return type('Args', (), values)()
+
+
+def _make_files(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.py").write_text("print('a')\n")
+    (tmp_path / "sub" / "b.py").write_text("x = 1\ny = 2\n")
+    return [str(tmp_path / "a.py"), str(tmp_path / "sub" / "b.py")]
+
+
+class TestPackagePipeline:
+    """Tests for lazily evaluated packaging stages"""
+
+    def test_dirs_only_never_reads_contents(self, tmp_path, monkeypatch):
+        """--dirs-only reports should not run the contents stage"""
+        def fail(*args, **kwargs):
+            raise AssertionError("contents should not be formatted")
+        monkeypatch.setattr(pipeline_module, "format_file_blocks", fail)
+        args = _args(dirs_only=True)
+
+        report = build_report(PackagePipeline(str(tmp_path), _make_files(tmp_path), args), args)
+
+        assert "file_contents" not in report
+        assert "b.py" in report["structure_tree"]
+        assert report["summary"] == "- Total files: 2"
+
+    def test_stages_are_computed_once(self, tmp_path, monkeypatch):
+        """Each stage should run at most once"""
+        calls = []
+        monkeypatch.setattr(pipeline_module, "get_git_info", lambda path: calls.append(path) or "git")
+        pipeline = PackagePipeline(str(tmp_path), _make_files(tmp_path), _args())
+
+        assert pipeline.git_info == "git"
+        assert pipeline.git_info == "git"
+        assert calls == [str(tmp_path)]
+
+    def test_contents_consume_a_streamed_source(self, tmp_path):
+        """The contents stage should record the files it pulls from a generator"""
+        files = _make_files(tmp_path)
+        pipeline = PackagePipeline(str(tmp_path), (f for f in files), _args())
+
+        blocks, total_lines, _ = pipeline.contents
+
+        assert [path for path, _ in blocks] == ["a.py", os.path.join("sub", "b.py")]
+        assert pipeline.file_list == files
+        assert total_lines == 5
+
+    def test_files_excluded_after_reading_leave_the_tree(self, tmp_path):
+        """A file the classifier excludes from its contents should not be listed or counted"""
+        from Repo_Code_Packager.classifier import load_policy
+        files = _make_files(tmp_path)
+        (tmp_path / "gen.py").write_text("# @generated\nx = 1\n")
+        files.append(str(tmp_path / "gen.py"))
+        args = _args(generated=load_policy({"generated": "exclude"}))
+
+        report = build_report(PackagePipeline(str(tmp_path), (f for f in files), args), args)
+
+        assert "gen.py" not in report["structure_tree"]
+        assert report["summary"].startswith("- Total files: 2")
+        assert not any("gen.py" in block for block in report["file_contents"])
+
+    def test_full_report_includes_contents_and_line_count(self, tmp_path):
+        """A normal report should contain the file blocks and total lines"""
+        args = _args()
+
+        report = build_report(PackagePipeline(str(tmp_path), _make_files(tmp_path), args), args)
+
+        assert len(report["file_contents"]) == 2
+        assert "Total lines: 5" in report["summary"]
+        assert "recent_changes" not in report
+
+    def test_recent_report_lists_files(self, tmp_path):
+        """--recent should add the recent changes section from the stat stage"""
+        args = _args(recent=True)
+
+        report = build_report(PackagePipeline(str(tmp_path), _make_files(tmp_path), args), args)
+
+        assert "- a.py (modified 0 days ago)" in report["recent_changes"]
+
+    def test_stats_read_before_contents_stay_in_line(self, tmp_path):
+        """Dropping excluded files should not leave stats paired with the wrong files"""
+        from Repo_Code_Packager.classifier import load_policy
+        (tmp_path / "gen.py").write_text("# @generated\nx = 1\n")
+        files = [str(tmp_path / "gen.py")] + _make_files(tmp_path)
+        pipeline = PackagePipeline(str(tmp_path), files, _args(generated=load_policy({"generated": "exclude"})))
+
+        assert len(pipeline.stats) == 3
+        pipeline.contents
+
+        assert pipeline.file_list == files[1:]
+        assert [stat.st_size for stat in pipeline.stats] == [os.path.getsize(f) for f in files[1:]]
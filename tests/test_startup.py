@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+import subprocess
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# extra wall-clock time a trivial invocation may add on top of a bare interpreter
+STARTUP_BUDGET_SECONDS = 0.2
+# modules that trivial invocations must not pay for
+HEAVY_MODULES = ("pygments", "tomllib", "subprocess", "concurrent.futures", "Repo_Code_Packager.content_packager")
+
+
+def _run(args, cwd, importtime=False):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + args
+    return subprocess.run(command, cwd=cwd, env=env, capture_output=True, text=True)
+
+
+def _imported_modules(stderr):
+    # -X importtime lines look like "import time: self | cumulative | module"
+    return {line.split("|")[-1].strip() for line in stderr.splitlines() if line.startswith("import time:")}
+
+
+def _best_time(args, cwd, runs=3):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(args, cwd)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class TestStartup:
+    """Tests for the import-time and startup budget of trivial invocations"""
+
+    def test_version_skips_heavy_imports(self, tmp_path):
+        """--version should not import pygments, tomllib, subprocess or thread pools"""
+        result = _run(["-m", "Repo_Code_Packager", "--version"], str(tmp_path), importtime=True)
+
+        assert result.returncode == 0
+        modules = _imported_modules(result.stderr)
+        assert not [m for m in modules if m.startswith(HEAVY_MODULES)]
+
+    def test_help_skips_heavy_imports(self, tmp_path):
+        """--help should not import heavy modules"""
+        result = _run(["-m", "Repo_Code_Packager", "--help"], str(tmp_path), importtime=True)
+
+        assert result.returncode == 0
+        assert "--dirs-only" in result.stdout
+        modules = _imported_modules(result.stderr)
+        assert not [m for m in modules if m.startswith(HEAVY_MODULES)]
+
+    def test_version_does_not_read_config(self, tmp_path):
+        """--version should work even next to a broken config file"""
+        (tmp_path / ".repo-code-packager-config.toml").write_text("not valid toml")
+
+        result = _run(["-m", "Repo_Code_Packager", "--version"], str(tmp_path))
+
+        assert result.returncode == 0
+        assert "0.1.0" in result.stdout
+
+    def test_dirs_only_skips_pygments(self, tmp_path):
+        """--dirs-only never lexes, so pygments should not be imported"""
+        (tmp_path / "a.py").write_text("print('a')\n")
+
+        result = _run(["-m", "Repo_Code_Packager", "--dirs-only", str(tmp_path)], str(tmp_path), importtime=True)
+
+        assert result.returncode == 0
+        assert "a.py" in result.stdout
+        assert not [m for m in _imported_modules(result.stderr) if m.startswith("pygments")]
+
+    def test_dirs_only_skips_json_and_the_reader(self, tmp_path):
+        """Markdown output without --index should not import json or the package reader"""
+        (tmp_path / "a.py").write_text("print('a')\n")
+
+        result = _run(["-m", "Repo_Code_Packager", "--dirs-only", str(tmp_path)], str(tmp_path), importtime=True)
+
+        assert result.returncode == 0
+        modules = _imported_modules(result.stderr)
+        assert "json" not in modules
+        assert "Repo_Code_Packager.package_reader" not in modules
+
+    def test_version_within_startup_budget(self, tmp_path):
+        """--version should add little wall-clock time over a bare interpreter"""
+        baseline = _best_time(["-c", "pass"], str(tmp_path))
+        tool = _best_time(["-m", "Repo_Code_Packager", "--version"], str(tmp_path))
+
+        assert tool - baseline < STARTUP_BUDGET_SECONDS